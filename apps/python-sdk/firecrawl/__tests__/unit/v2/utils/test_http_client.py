@@ -0,0 +1,177 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from firecrawl.v2.utils.http_client import HttpClient, version
+
+
+def _response(status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+class TestHttpClientSession:
+    """Unit tests for the pooled session used by HttpClient."""
+
+    def test_session_is_reused_across_requests(self):
+        """All verbs should go through the same persistent session."""
+        client = HttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+        with patch.object(requests.Session, "request", return_value=_response()) as mock_request:
+            client.post("/v2/scrape", {"url": "https://example.com"})
+            client.get("/v2/crawl/123")
+            client.delete("/v2/crawl/123")
+
+        assert mock_request.call_count == 3
+        assert [c.args[0] for c in mock_request.call_args_list] == ["POST", "GET", "DELETE"]
+
+    def test_post_sends_serialized_json_body(self):
+        """POST bodies should be sent as pre-serialized JSON bytes."""
+        client = HttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+        with patch.object(requests.Session, "request", return_value=_response()) as mock_request:
+            client.post("/v2/scrape", {"url": "https://example.com"})
+            client.get("/v2/crawl/123")
+
+        post_kwargs = mock_request.call_args_list[0].kwargs
+        assert json.loads(post_kwargs["data"]) == {"url": "https://example.com", "origin": f"python-sdk@{version}"}
+        assert mock_request.call_args_list[1].kwargs["data"] is None
+        assert client._session.headers["Content-Type"] == "application/json"
+
+    def test_context_manager_closes_session(self):
+        """Exiting the context manager should close the session."""
+        client = HttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+        with patch.object(client._session, "close") as mock_close:
+            with client:
+                pass
+        mock_close.assert_called_once()
+
+    def test_adapter_retries_502(self):
+        """The mounted adapter should retry 502s for all verbs the client uses."""
+        client = HttpClient(api_key="test", api_url="https://api.firecrawl.dev", max_retries=5, backoff_factor=2)
+        retry = client._session.get_adapter("https://api.firecrawl.dev").max_retries
+
+        # 5 attempts in total: the first request plus 4 retries
+        assert retry.total == 4
+        assert retry.backoff_factor == 2
+        assert 502 in retry.status_forcelist
+        assert {"GET", "POST", "DELETE"} <= set(retry.allowed_methods)
+        assert retry.raise_on_status is False
+
+    def test_max_retries_counts_attempts(self):
+        """A persistent 502 should be attempted max_retries times in total."""
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(502)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with HttpClient(api_key="test", api_url=f"http://127.0.0.1:{server.server_port}", max_retries=3, backoff_factor=0) as client:
+                response = client.get("/v2/crawl/123")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.status_code == 502
+        assert len(hits) == 3
+
+    def test_first_retry_backoff_is_backoff_factor(self):
+        """The first retry should wait up to backoff_factor, not retry immediately."""
+        client = HttpClient(api_key="test", api_url="https://api.firecrawl.dev", backoff_factor=0.5)
+        retry = client._session.get_adapter("https://api.firecrawl.dev").max_retries
+        retry = retry.increment(method="GET", url="/v2/crawl/123", response=HTTPResponse(status=502))
+
+        with patch("random.uniform", side_effect=lambda a, b: b) as mock_uniform:
+            assert retry.get_backoff_time() == 0.5
+        mock_uniform.assert_called_once_with(0, 0.5)
+
+        retry = retry.increment(method="GET", url="/v2/crawl/123", response=HTTPResponse(status=502))
+        with patch("random.uniform", side_effect=lambda a, b: b):
+            assert retry.get_backoff_time() == 1.0
+
+    def test_retry_backoff_uses_capped_full_jitter(self):
+        """Backoff for retry n should be drawn from [0, min(backoff * 2**(n-1), cap)]."""
+        client = HttpClient(api_key="test", api_url="https://api.firecrawl.dev", max_retries=10, backoff_factor=10)
+        retry = client._session.get_adapter("https://api.firecrawl.dev").max_retries
+        for _ in range(4):
+            retry = retry.increment(method="GET", url="/v2/crawl/123", response=HTTPResponse(status=502))
+
+        with patch("random.uniform", side_effect=lambda a, b: b) as mock_uniform:
+            assert retry.get_backoff_time() == 30.0
+        mock_uniform.assert_called_once_with(0, 30.0)
+
+
+class TestHttpClientBuildUrl:
+    """Unit tests for HttpClient._build_url."""
+
+    def setup_method(self):
+        self.client = HttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+
+    def test_relative_endpoint(self):
+        assert self.client._build_url("/v2/scrape") == "https://api.firecrawl.dev/v2/scrape"
+        assert self.client._build_url("v2/scrape") == "https://api.firecrawl.dev/v2/scrape"
+
+    def test_absolute_endpoint_is_pinned_to_base_host(self):
+        assert self.client._build_url("http://api.firecrawl.dev/v2/crawl/1?skip=10") == \
+            "https://api.firecrawl.dev/v2/crawl/1?skip=10"
+        assert self.client._build_url("https://evil.example.com/v2/crawl/1") == \
+            "https://api.firecrawl.dev/v2/crawl/1"
+
+    def test_same_host_fast_path_matches_full_parse(self):
+        endpoints = [
+            "https://api.firecrawl.dev",
+            "https://api.firecrawl.dev/v2/crawl/1",
+            "https://api.firecrawl.dev/v2/crawl/1?skip=10",
+            "https://api.firecrawl.dev/v2/crawl/1?",
+            "https://api.firecrawl.dev/v2/crawl/1#frag",
+            "https://api.firecrawl.dev:8443/v2/crawl/1",
+            "https://api.firecrawl.dev.evil.com/v2/crawl/1",
+        ]
+        for endpoint in endpoints:
+            slow = HttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+            slow._base_prefix = "\0"  # disable the fast path
+            assert self.client._build_url(endpoint) == slow._build_url(endpoint), endpoint
+
+    def test_protocol_relative_endpoint(self):
+        assert self.client._build_url("//evil.example.com/v2/crawl/1") == \
+            "https://api.firecrawl.dev/v2/crawl/1"
+
+    def test_base_url_with_path(self):
+        client = HttpClient(api_key="test", api_url="http://localhost:3002/")
+        assert client._build_url("/v2/scrape") == "http://localhost:3002/v2/scrape"
+
+
+class TestHttpClientHeaders:
+    """Unit tests for HttpClient._prepare_headers."""
+
+    def test_bearer_uses_stripped_key(self):
+        client = HttpClient(api_key=" fc-test\n", api_url="https://api.firecrawl.dev")
+        headers = client._prepare_headers()
+        assert headers["Authorization"] == "Bearer fc-test"
+        assert headers["Content-Type"] == "application/json"
+
+    def test_idempotency_key(self):
+        client = HttpClient(api_key="fc-test", api_url="https://api.firecrawl.dev")
+        assert client._prepare_headers("abc")["x-idempotency-key"] == "abc"
+        assert "x-idempotency-key" not in client._prepare_headers()
+
+    def test_default_headers_are_shared_and_read_only(self):
+        client = HttpClient(api_key="fc-test", api_url="https://api.firecrawl.dev")
+        headers = client._prepare_headers()
+        assert headers is client._prepare_headers()
+        with pytest.raises(TypeError):
+            headers["x-extra"] = "1"  # type: ignore[index]
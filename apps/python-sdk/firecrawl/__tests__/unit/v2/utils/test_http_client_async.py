@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _mock_client(handler) -> AsyncHttpClient:
+    client = AsyncHttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+    client._client._transport = httpx.MockTransport(handler)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_default_headers_sent_without_overrides():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"success": True})
+
+    client = _mock_client(handler)
+    await client.get("/v2/crawl/123")
+    await client.close()
+
+    assert seen[0].url == "https://api.firecrawl.dev/v2/crawl/123"
+    assert seen[0].headers["Authorization"] == "Bearer test"
+    assert seen[0].headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_override_headers_merged_over_defaults():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"success": True})
+
+    client = _mock_client(handler)
+    await client.post("/v2/batch/scrape", {"urls": ["https://example.com"]}, headers={"x-idempotency-key": "abc"})
+    await client.close()
+
+    assert seen[0].headers["Authorization"] == "Bearer test"
+    assert seen[0].headers["x-idempotency-key"] == "abc"
+    body = json.loads(seen[0].content)
+    assert body["urls"] == ["https://example.com"]
+    assert body["origin"].startswith("python-sdk@")
+
+
+@pytest.mark.asyncio
+async def test_post_many_bounds_concurrency_and_keeps_order(monkeypatch):
+    active = 0
+    max_active = 0
+
+    async def fake_post(self, endpoint, data, headers=None, timeout=None):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        try:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"url": data["url"]})
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(AsyncHttpClient, "post", fake_post)
+
+    client = AsyncHttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+    payloads = [{"url": f"https://example.com/{i}"} for i in range(10)]
+    responses = await client.post_many("/v2/scrape", payloads, concurrency=3)
+    await client.close()
+
+    assert [r.json()["url"] for r in responses] == [p["url"] for p in payloads]
+    assert max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_post_many_does_not_mutate_payloads():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        return httpx.Response(200, json={"success": True})
+
+    client = _mock_client(handler)
+    payloads = [{"url": "https://example.com/1"}, {"url": "https://example.com/2"}]
+    await client.post_many("/v2/scrape", payloads)
+    await client.close()
+
+    assert payloads == [{"url": "https://example.com/1"}, {"url": "https://example.com/2"}]
+    assert all(body["origin"].startswith("python-sdk@") for body in seen)
+
+
+@pytest.mark.asyncio
+async def test_get_many():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = _mock_client(handler)
+    responses = await client.get_many(["/v2/crawl/1", "/v2/crawl/2"])
+    await client.close()
+
+    assert [r.json()["path"] for r in responses] == ["/v2/crawl/1", "/v2/crawl/2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_many_rejects_invalid_concurrency(concurrency):
+    client = AsyncHttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await client.post_many("/v2/scrape", [{"url": "https://example.com"}], concurrency=concurrency)
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await client.get_many(["/v2/crawl/1"], concurrency=concurrency)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_client():
+    async with AsyncHttpClient(api_key="test", api_url="https://api.firecrawl.dev") as client:
+        assert not client._client.is_closed
+    assert client._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_env_proxy_is_respected(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local:8080")
+    client = AsyncHttpClient(api_key="test", api_url="https://api.firecrawl.dev")
+    try:
+        assert client._client._mounts
+    finally:
+        await client.close()
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from firecrawl.v2.utils import serialization
+from firecrawl.v2.utils.serialization import dumps_json
+
+
+PAYLOAD = {"url": "https://example.com", "formats": ["markdown"], "title": "héllo", "limit": 10, "extra": None}
+
+
+def test_dumps_json_returns_utf8_bytes():
+    body = dumps_json(PAYLOAD)
+    assert isinstance(body, bytes)
+    assert json.loads(body.decode("utf-8")) == PAYLOAD
+
+
+def test_dumps_json_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    body = dumps_json(PAYLOAD)
+    assert isinstance(body, bytes)
+    assert json.loads(body.decode("utf-8")) == PAYLOAD
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_dumps_json_stdlib_fallback_rejects_non_finite(monkeypatch, value):
+    monkeypatch.setattr(serialization, "orjson", None)
+    with pytest.raises(ValueError):
+        dumps_json({"value": value})
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_dumps_json_orjson_rejects_non_finite(value):
+    pytest.importorskip("orjson")
+    assert serialization.orjson is not None
+    with pytest.raises(ValueError):
+        dumps_json({"value": value})
+
+
+def test_dumps_json_orjson_keeps_none():
+    pytest.importorskip("orjson")
+    assert json.loads(dumps_json(PAYLOAD)) == PAYLOAD
+
+
+def test_dumps_json_big_int_falls_back_to_stdlib():
+    pytest.importorskip("orjson")
+    assert json.loads(dumps_json({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+
+def test_dumps_json_lone_surrogate_falls_back_to_stdlib():
+    pytest.importorskip("orjson")
+    assert json.loads(dumps_json({"s": "a\ud800b"})) == {"s": "a\ud800b"}
+
+
+def test_dumps_json_null_strings_skip_non_finite_walk(monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(serialization, "_has_non_finite", lambda data: pytest.fail("payload walked"))
+    payload = {"url": "https://example.com/null", "schema": {"anyOf": [{"type": "string"}, {"type": "null"}]}}
+    assert json.loads(dumps_json(payload)) == payload
+
+
+@pytest.mark.parametrize("payload", [{"a": [1.0, float("nan")]}, {"a": {"b": float("inf")}}, [float("-inf")]])
+def test_dumps_json_orjson_rejects_nested_non_finite(payload):
+    pytest.importorskip("orjson")
+    with pytest.raises(ValueError):
+        dumps_json(payload)
@@ -72,8 +72,8 @@ class FirecrawlClient:
             api_key: Firecrawl API key (or set FIRECRAWL_API_KEY env var)
             api_url: Base URL for the Firecrawl API
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retries for failed requests
-            backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait 0.5s, then 1s, then 2s between retries)
+            max_retries: Maximum number of attempts per request, including the first one
+            backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait up to 0.5s, then up to 1s between attempts)
         """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -92,7 +92,12 @@ class FirecrawlClient:
             backoff_factor=backoff_factor
         )
         
-        self.http_client = HttpClient(api_key, api_url)
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor
+        )
     
     def scrape(
         self,
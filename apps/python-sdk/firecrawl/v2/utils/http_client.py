@@ -2,175 +2,203 @@
 HTTP client utilities for v2 API.
 """
 
-import time
-from typing import Dict, Any, Optional
+import logging
+import random
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from urllib.parse import urlparse, urlunparse, urljoin
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .get_version import get_version
+from .serialization import dumps_json
 
 version = get_version()
+_ORIGIN = f"python-sdk@{version}"
+
+logger = logging.getLogger("firecrawl")
+
+# Upper bound for a single retry sleep, in seconds
+_MAX_BACKOFF = 30.0
+
+
+@lru_cache(maxsize=256)
+def _parse_endpoint(endpoint: str) -> Tuple[bool, str, str]:
+    """Split an endpoint into (is_absolute, path, query)."""
+    ep = urlparse(endpoint)
+    if not ep.netloc:
+        return False, ep.path, ep.query
+    return True, ep.path or "/", ep.query
+
+
+@lru_cache(maxsize=32)
+def _backoff_delays(backoff_factor: float) -> Tuple[float, ...]:
+    """Capped backoff delays; entry i is the upper bound before retry i + 1."""
+    # backoff_factor, then 2x, 4x, ... Entries past the table are all capped.
+    return tuple(min(backoff_factor * (1 << i), _MAX_BACKOFF) for i in range(32))
+
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry using full jitter over a precomputed delay table."""
+
+    def get_backoff_time(self) -> float:
+        # requests follows redirects itself, so history only records errors
+        failures = len(self.history)
+        if failures == 0:
+            return 0
+        delays = _backoff_delays(self.backoff_factor)
+        backoff = delays[min(failures - 1, len(delays) - 1)]
+        # Sleep a random amount up to the exponential delay so concurrent
+        # clients do not retry in lockstep.
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
 
 class HttpClient:
     """HTTP client with retry logic and error handling."""
     
-    def __init__(self, api_key: str, api_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5
+    ):
         self.api_key = api_key
         self.api_url = api_url
+        self._stripped_key = api_key.strip() if api_key else ""
+        self._bearer = f"Bearer {self._stripped_key}" if self._stripped_key else None
+        default_headers = {'Content-Type': 'application/json'}
+        if self._bearer is not None:
+            default_headers['Authorization'] = self._bearer
+        self._default_headers = MappingProxyType(default_headers)
+        # Parse the base URL once; _build_url runs on every request.
+        base = urlparse(api_url)
+        self._base_scheme = base.scheme or "https"
+        self._base_netloc = base.netloc
+        self._base_str = api_url if api_url.endswith("/") else f"{api_url}/"
+        self._base_prefix = f"{self._base_scheme}://{self._base_netloc}"
+        # Persistent session so TCP/TLS connections are reused across calls.
+        # 502s and connection errors are retried by urllib3 inside the adapter.
+        retry = _JitteredRetry(
+            # max_retries counts attempts, as the old retry loop did; urllib3's
+            # total counts retries after the first attempt
+            total=max(max_retries - 1, 0),
+            backoff_factor=backoff_factor,
+            status_forcelist=[502],
+            allowed_methods=["GET", "POST", "DELETE"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        # Bodies are pre-serialized bytes, so requests no longer sets this itself
+        self._session.headers["Content-Type"] = "application/json"
+        adapter = HTTPAdapter(pool_connections=100, pool_maxsize=100, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Safety net for clients that are never closed explicitly
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def _build_url(self, endpoint: str) -> str:
-        base = urlparse(self.api_url)
-        ep = urlparse(endpoint)
-
-        # Absolute or protocol-relative (has netloc)
-        if ep.netloc:
-            # Different host: keep path/query but force base host/scheme (no token leakage)
-            path = ep.path or "/"
-            if (ep.hostname or "") != (base.hostname or ""):
-                return urlunparse((base.scheme or "https", base.netloc, path, "", ep.query, ""))
-            # Same host: normalize scheme to base
-            return urlunparse((base.scheme or "https", base.netloc, path, "", ep.query, ""))
+        # Fast path: absolute URL already on the base scheme/host with nothing
+        # that the urlparse round-trip below would rewrite
+        if endpoint.startswith(self._base_prefix):
+            rest = endpoint[len(self._base_prefix):]
+            if not rest:
+                return f"{self._base_prefix}/"
+            if rest[0] == "/" and not any(c in rest for c in ";#") and not rest.endswith("?"):
+                return endpoint
+
+        is_absolute, path, query = _parse_endpoint(endpoint)
+
+        # Absolute or protocol-relative (has netloc): keep path/query but always
+        # force the base scheme/host, so the token never leaks to another host
+        if is_absolute:
+            return urlunparse((self._base_scheme, self._base_netloc, path, "", query, ""))
 
         # Relative (including leading slash or not)
-        base_str = self.api_url if self.api_url.endswith("/") else f"{self.api_url}/"
-        # Guard protocol-relative like //host/path slipping through as “relative”
-        if endpoint.startswith("//"):
-            ep2 = urlparse(f"https:{endpoint}")
-            path = ep2.path or "/"
-            return urlunparse((base.scheme or "https", base.netloc, path, "", ep2.query, ""))
-        return urljoin(base_str, endpoint)
+        return urljoin(self._base_str, endpoint)
     
-    def _prepare_headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
-        """Prepare headers for API requests."""
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.api_key}',
-        }
-        
-        if idempotency_key:
-            headers['x-idempotency-key'] = idempotency_key
-            
+    def _prepare_headers(self, idempotency_key: Optional[str] = None) -> Mapping[str, str]:
+        """
+        Prepare headers for API requests.
+
+        Without an idempotency key this returns a shared read-only mapping;
+        callers must copy it before adding headers.
+        """
+        if not idempotency_key:
+            return self._default_headers
+
+        headers = dict(self._default_headers)
+        headers['x-idempotency-key'] = idempotency_key
         return headers
     
-    def post(
+    def _request(
         self,
+        method: str,
         endpoint: str,
-        data: Dict[str, Any],
-        headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        *,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None
     ) -> requests.Response:
-        """Make a POST request with retry logic."""
+        """Make a request; retries are handled by the session's adapter."""
         if headers is None:
             headers = self._prepare_headers()
 
-        data['origin'] = f'python-sdk@{version}'
-            
         url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=data,
-                    timeout=timeout
-                )
-
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in POST request")
+        try:
+            return self._session.request(
+                method,
+                url,
+                headers=headers,
+                data=dumps_json(data) if data is not None else None,
+                timeout=timeout
+            )
+        except requests.RequestException as e:
+            logger.debug("%s %s failed after retries: %s", method, url, e)
+            raise
+    
+    def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> requests.Response:
+        """Make a POST request with retry logic. Sets data['origin'] in place."""
+        data['origin'] = _ORIGIN
+        return self._request("POST", endpoint, data=data, headers=headers, timeout=timeout)
     
     def get(
         self,
         endpoint: str,
-        headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None
     ) -> requests.Response:
         """Make a GET request with retry logic."""
-        if headers is None:
-            headers = self._prepare_headers()
-
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in GET request")
+        return self._request("GET", endpoint, headers=headers, timeout=timeout)
     
     def delete(
         self,
         endpoint: str,
-        headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None
     ) -> requests.Response:
         """Make a DELETE request with retry logic."""
-        if headers is None:
-            headers = self._prepare_headers()
-            
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.delete(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in DELETE request")
\ No newline at end of file
+        return self._request("DELETE", endpoint, headers=headers, timeout=timeout)
@@ -1,57 +1,85 @@
+import asyncio
+import importlib.util
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from .get_version import get_version
+from .serialization import dumps_json
 
 version = get_version()
+_ORIGIN = f"python-sdk@{version}"
+
+# HTTP/2 needs the optional `h2` package (installed via `httpx[http2]`).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class AsyncHttpClient:
     def __init__(self, api_key: str, api_url: str):
         self.api_key = api_key
         self.api_url = api_url
+        self._stripped_key = api_key.strip() if api_key else ""
+        self._bearer = f"Bearer {self._stripped_key}" if self._stripped_key else None
+        default_headers = {"Content-Type": "application/json"}
+        if self._bearer is not None:
+            default_headers["Authorization"] = self._bearer
+        # Limits and HTTP/2 are set on the client rather than through an explicit
+        # transport: passing transport= disables HTTP(S)_PROXY/NO_PROXY handling.
         self._client = httpx.AsyncClient(
             base_url=api_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            limits=httpx.Limits(max_keepalive_connections=0),
+            headers=default_headers,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=100,
+                keepalive_expiry=30.0,
+            ),
         )
 
     async def close(self) -> None:
         await self._client.aclose()
 
-    def _headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
-        headers: Dict[str, str] = {}
-        if idempotency_key:
-            headers["x-idempotency-key"] = idempotency_key
-        return headers
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
 
-    async def post(
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _request(
         self,
+        method: str,
         endpoint: str,
-        data: Dict[str, Any],
+        *,
+        data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
     ) -> httpx.Response:
-        payload = dict(data)
-        payload["origin"] = f"python-sdk@{version}"
-        return await self._client.post(
+        # Authorization and Content-Type are client defaults; httpx merges any
+        # per-request headers over them, so no dict is built when none are given.
+        return await self._client.request(
+            method,
             endpoint,
-            json=payload,
-            headers={**self._headers(), **(headers or {})},
+            content=dumps_json(data) if data is not None else None,
+            headers=headers,
             timeout=timeout,
         )
 
+    async def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """POST data to endpoint. Sets data["origin"] in place rather than copying the payload."""
+        data["origin"] = _ORIGIN
+        return await self._request("POST", endpoint, data=data, headers=headers, timeout=timeout)
+
     async def get(
         self,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.get(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
-        )
+        return await self._request("GET", endpoint, headers=headers, timeout=timeout)
 
     async def delete(
         self,
@@ -59,7 +87,46 @@ class AsyncHttpClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.delete(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
-        )
+        return await self._request("DELETE", endpoint, headers=headers, timeout=timeout)
+
+    async def post_many(
+        self,
+        endpoint: str,
+        payloads: List[Dict[str, Any]],
+        *,
+        concurrency: int = 32,
+        timeout: Optional[float] = None,
+    ) -> List[httpx.Response]:
+        """
+        POST each payload to endpoint concurrently; responses keep payload order.
+
+        Each payload is shallow-copied before sending, so the caller's dicts are
+        not modified.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(payload: Dict[str, Any]) -> httpx.Response:
+            async with semaphore:
+                return await self.post(endpoint, dict(payload), timeout=timeout)
+
+        return await asyncio.gather(*[_one(p) for p in payloads])
+
+    async def get_many(
+        self,
+        endpoints: List[str],
+        *,
+        concurrency: int = 32,
+        timeout: Optional[float] = None,
+    ) -> List[httpx.Response]:
+        """GET each endpoint concurrently; responses keep endpoint order."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(endpoint: str) -> httpx.Response:
+            async with semaphore:
+                return await self.get(endpoint, timeout=timeout)
 
+        return await asyncio.gather(*[_one(e) for e in endpoints])
@@ -0,0 +1,54 @@
+"""
+JSON serialization helpers for v2 API request bodies.
+"""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# A bare null value in orjson's compact output; quoted "null" strings (URLs,
+# JSON schema types) do not match these
+_NULL_TOKENS = (b":null", b",null", b"[null")
+
+
+def _dumps_stdlib(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _has_non_finite(data: Any) -> bool:
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize a request payload to UTF-8 JSON bytes, using orjson when available.
+
+    Non-finite floats (NaN, +/-inf) raise ValueError, as requests and httpx do.
+    """
+    if orjson is None:
+        return _dumps_stdlib(data)
+    try:
+        body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits or lone surrogates, which the stdlib handles
+        return _dumps_stdlib(data)
+    # orjson writes non-finite floats as null; only walk the payload when it
+    # contains a bare null value
+    if (body == b"null" or any(t in body for t in _NULL_TOKENS)) and _has_non_finite(data):
+        raise ValueError("Out of range float values are not JSON compliant")
+    return body